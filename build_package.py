@@ -1,67 +1,104 @@
-# Build and Distribution Script for MeasureBot
-# Run this to create distribution packages
-
-import subprocess
-import sys
-import os
-
-def run_command(cmd, description):
-    """Run a command and print the result."""
-    print(f"\n{'='*50}")
-    print(f"Running: {description}")
-    print(f"Command: {cmd}")
-    print(f"{'='*50}")
-    
-    try:
-        result = subprocess.run(cmd, shell=True, check=True, capture_output=True, text=True)
-        print("✅ Success!")
-        if result.stdout:
-            print("Output:", result.stdout)
-        return True
-    except subprocess.CalledProcessError as e:
-        print("❌ Failed!")
-        print("Error:", e.stderr)
-        return False
-
-def main():
-    """Build the package for distribution."""
-    
-    # Check if we're in the right directory
-    if not os.path.exists("setup.py"):
-        print("❌ Error: setup.py not found. Run this script from the measurebot root directory.")
-        return
-    
-    # Install build dependencies
-    print("Installing build dependencies...")
-    run_command(f"{sys.executable} -m pip install --upgrade build twine", "Installing build tools")
-    
-    # Clean old builds
-    if os.path.exists("dist"):
-        import shutil
-        shutil.rmtree("dist")
-        print("🧹 Cleaned old dist directory")
-    
-    if os.path.exists("measurebot.egg-info"):
-        import shutil
-        shutil.rmtree("measurebot.egg-info")
-        print("🧹 Cleaned old egg-info directory")
-    
-    # Build the package
-    if run_command(f"{sys.executable} -m build", "Building distribution packages"):
-        print("\n✅ Package built successfully!")
-        print("📦 Distribution files created in ./dist/")
-        
-        if os.path.exists("dist"):
-            dist_files = os.listdir("dist")
-            for file in dist_files:
-                print(f"   - {file}")
-        
-        print("\n📋 Next steps:")
-        print("1. To install locally: pip install dist/measurebot-0.1.0-py3-none-any.whl")
-        print("2. To upload to PyPI: twine upload dist/*")
-        print("3. To install from GitHub: pip install git+https://github.com/sharpelab/measurebot.git")
-    else:
-        print("❌ Build failed!")
-
-if __name__ == "__main__":
+# Build and Distribution Script for MeasureBot
+# Run this to create distribution packages
+
+import argparse
+import hashlib
+import shlex
+import subprocess
+import sys
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor, wait
+from pathlib import Path
+
+BUILD_HASH_FILE = Path("dist") / ".build-hash"
+
+def run_command(cmd, description):
+    """Run a command (argument list), streaming its output as it arrives."""
+    print(f"\n{'='*50}")
+    print(f"Running: {description}")
+    print(f"Command: {shlex.join(cmd)}")
+    print(f"{'='*50}")
+    
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1)
+    for line in proc.stdout:
+        print(line, end="")
+    if proc.wait() == 0:
+        print("✅ Success!")
+        return True
+    else:
+        print("❌ Failed!")
+        return False
+
+def clean_dir(path):
+    """Remove a build directory if it exists."""
+    if os.path.exists(path):
+        shutil.rmtree(path, ignore_errors=True)
+        print(f"🧹 Cleaned old {path} directory")
+
+def source_hash():
+    """Hash the package sources and build metadata."""
+    h = hashlib.sha256()
+    paths = sorted(Path("measurebot").rglob("*.py")) + [Path("setup.py"), Path("pyproject.toml"), Path("README.md")]
+    for path in paths:
+        if path.exists():
+            h.update(str(path).encode())
+            h.update(path.read_bytes())
+    return h.hexdigest()
+
+def build_is_current(digest):
+    """True if dist/ holds a wheel built from sources with this hash."""
+    return (
+        BUILD_HASH_FILE.exists()
+        and any(Path("dist").glob("*.whl"))
+        and BUILD_HASH_FILE.read_text().strip() == digest
+    )
+
+def main():
+    """Build the package for distribution."""
+    parser = argparse.ArgumentParser(description="Build MeasureBot distribution packages")
+    parser.add_argument("--force", action="store_true", help="Rebuild even if sources are unchanged")
+    args = parser.parse_args()
+    
+    # Check if we're in the right directory
+    if not os.path.exists("setup.py"):
+        print("❌ Error: setup.py not found. Run this script from the measurebot root directory.")
+        return
+    
+    # Skip the build entirely if nothing changed since the last one
+    digest = source_hash()
+    if not args.force and build_is_current(digest):
+        print("✅ Build up-to-date, skipping (use --force to rebuild)")
+        return
+    
+    # Install build dependencies and clean old builds concurrently;
+    # none of these depend on each other
+    print("Installing build dependencies...")
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        wait([
+            pool.submit(run_command, [sys.executable, "-m", "pip", "install", "--upgrade", "build", "twine"], "Installing build tools"),
+            pool.submit(clean_dir, "dist"),
+            pool.submit(clean_dir, "measurebot.egg-info"),
+        ])
+    
+    # Build the package
+    if run_command([sys.executable, "-m", "build"], "Building distribution packages"):
+        BUILD_HASH_FILE.write_text(digest)
+        print("\n✅ Package built successfully!")
+        print("📦 Distribution files created in ./dist/")
+        
+        if os.path.exists("dist"):
+            dist_files = os.listdir("dist")
+            for file in dist_files:
+                if not file.startswith("."):
+                    print(f"   - {file}")
+        
+        print("\n📋 Next steps:")
+        print("1. To install locally: pip install dist/measurebot-0.1.0-py3-none-any.whl")
+        print("2. To upload to PyPI: twine upload dist/*")
+        print("3. To install from GitHub: pip install git+https://github.com/sharpelab/measurebot.git")
+    else:
+        print("❌ Build failed!")
+
+if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,36 +1,39 @@
-"""
-MeasureBot - Simple notifications via Discord and email for lab automation.
-
-This package provides easy-to-use functions for sending notifications
-from Python scripts, particularly useful in laboratory automation and
-data analysis workflows.
-"""
-
-__version__ = "0.1.0"
-__author__ = "Aaron Sharpe"
-__email__ = "aaron@aaronsharpe.science"
-
-# Import main functionality for easy access
-from .alerts import (
-    set_defaults,
-    show_config,
-    send_discord_message,
-    send_email,
-    discord,
-    email,
-    alert
-)
-
-# Also import the alerts module itself
-from . import alerts
-
-__all__ = [
-    'alerts',
-    'set_defaults',
-    'show_config', 
-    'send_discord_message',
-    'send_email',
-    'discord',
-    'email',
-    'alert'
-]
\ No newline at end of file
+"""
+MeasureBot - Simple notifications via Discord and email for lab automation.
+
+This package provides easy-to-use functions for sending notifications
+from Python scripts, particularly useful in laboratory automation and
+data analysis workflows.
+"""
+
+__version__ = "0.1.0"
+__author__ = "Aaron Sharpe"
+__email__ = "aaron@aaronsharpe.science"
+
+import importlib
+
+# Main functionality is re-exported from alerts lazily, so importing the
+# package (e.g. for measurebot.ups) doesn't load .env or the HTTP/SMTP clients
+__all__ = [
+    'alerts',
+    'set_defaults',
+    'show_config', 
+    'send_discord_message',
+    'send_email',
+    'discord',
+    'email',
+    'alert'
+]
+
+
+def __getattr__(name):
+    if name in __all__:
+        alerts = importlib.import_module(".alerts", __name__)
+        value = alerts if name == "alerts" else getattr(alerts, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,11 +1,28 @@
+import json
 import os
 import re
-import smtplib
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
-import requests
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+# requests, smtplib and email are imported on first send (see _get_requests and
+# send_email): requests alone costs tens of ms, which import-only callers skip.
+
+CACHE_DIR = Path.home() / ".cache" / "measurebot"
+
+
+def _atomic_write_text(path: Path, text: str):
+    """Write a file via temp file + rename so readers never see a partial write.
+
+    Files are created owner-only since caches may hold tokens or addresses.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as f:
+        f.write(text)
+    os.replace(tmp, path)
+
 
 # Load environment variables from .env file if it exists.
 # Search order: $MEASUREBOT_ENV, ~/.config/measurebot/.env, cwd/.env, package-adjacent .env
@@ -24,62 +41,170 @@ def _find_env_file():
         return pkg_env
     return None
 
+
+# KEY=VALUE, surrounding whitespace ignored; comments and blank lines don't match
+_ENV_LINE = re.compile(r"^\s*([A-Za-z_][A-Za-z0-9_.-]*)\s*=\s*(.*?)\s*$")
+
+
+def _parse_env_file(path: str) -> dict[str, str]:
+    """Parse a .env file into a dict, stripping matching quotes from values."""
+    parsed = {}
+    with open(path) as f:
+        for line in f:
+            m = _ENV_LINE.match(line)
+            if not m:
+                continue
+            key, value = m.groups()
+            if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+                value = value[1:-1]
+            parsed[key] = value
+    return parsed
+
+
 _env_file = _find_env_file()
 if _env_file:
-    with open(_env_file) as f:
-        for line in f:
-            line = line.strip()
-            if line and not line.startswith('#') and '=' in line:
-                key, value = line.split('=', 1)
-                key = key.strip()
-                value = value.strip()
-                # Remove quotes if present
-                if value.startswith('"') and value.endswith('"'):
-                    value = value[1:-1]
-                elif value.startswith("'") and value.endswith("'"):
-                    value = value[1:-1]
-                os.environ[key] = value
+    os.environ.update(_parse_env_file(_env_file))
 
 # Discord configuration
 BOT_TOKEN = os.getenv("DISCORD_BOT_TOKEN")
 
-# Build channel map from env: DISCORD_CHANNEL_<NAME>=<ID>
-CHANNELS = {
-    m.group(1).lower(): v
-    for k, v in os.environ.items()
-    if (m := re.match(r"DISCORD_CHANNEL_([A-Z0-9_-]+)", k, re.IGNORECASE))
-}
-
-# Build user map from env: DISCORD_USER_<USERNAME>=<ID>
-USERS = {
-    m.group(1).lower(): v
-    for k, v in os.environ.items()
-    if (m := re.match(r"DISCORD_USER_([A-Z0-9_-]+)", k, re.IGNORECASE))
-}
-
-# Build email recipients map from env: EMAIL_TO_<USERNAME>=<EMAIL>
-EMAIL_RECIPIENTS = {
-    m.group(1).lower(): v
-    for k, v in os.environ.items()
-    if (m := re.match(r"EMAIL_TO_([A-Z0-9_-]+)", k, re.IGNORECASE))
-}
+# Build name registries from env in a single pass:
+#   DISCORD_CHANNEL_<NAME>=<ID>     -> CHANNELS
+#   DISCORD_USER_<USERNAME>=<ID>    -> USERS
+#   EMAIL_TO_<USERNAME>=<EMAIL>     -> EMAIL_RECIPIENTS
+#   SLACK_CHANNEL_<NAME>=<ID>       -> SLACK_CHANNELS
+#   SLACK_USER_<USERNAME>=<ID>      -> SLACK_USERS
+CHANNELS, USERS, EMAIL_RECIPIENTS = {}, {}, {}
+SLACK_CHANNELS, SLACK_USERS = {}, {}
+
+_REGISTRY_PREFIXES = (
+    ("DISCORD_CHANNEL_", CHANNELS),
+    ("DISCORD_USER_", USERS),
+    ("EMAIL_TO_", EMAIL_RECIPIENTS),
+    ("SLACK_CHANNEL_", SLACK_CHANNELS),
+    ("SLACK_USER_", SLACK_USERS),
+)
+
+for _key, _value in os.environ.items():
+    _key_upper = _key.upper()
+    for _prefix, _registry in _REGISTRY_PREFIXES:
+        if _key_upper.startswith(_prefix) and len(_key_upper) > len(_prefix):
+            _registry[_key_upper[len(_prefix):].lower()] = _value
+            break
+
+# Shared HTTPS session for Discord: keeps one keep-alive TLS connection to
+# discord.com instead of paying a handshake per request.
+DISCORD_API = "https://discord.com/api/v10"
+HTTP_TIMEOUT = (3.05, 10)  # (connect, read) seconds
+
+_requests = None
+_session = None
+_session_lock = threading.Lock()
+
+
+def _get_requests():
+    """Import and return the requests module on first use."""
+    global _requests
+    if _requests is None:
+        import requests
+        _requests = requests
+    return _requests
+
+
+def _get_session():
+    """Return the shared Discord session, creating it on first use."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            requests = _get_requests()
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            session = requests.Session()
+            session.mount("https://", HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=16,
+                # Discord endpoints are POST, which isn't idempotent: only retry
+                # when the message can't have been created (connect failures,
+                # 429 rate limits), never read timeouts or 5xx responses
+                max_retries=Retry(
+                    total=3,
+                    connect=3,
+                    read=0,
+                    other=0,
+                    backoff_factor=0.3,
+                    status_forcelist=[429],
+                    allowed_methods=None,
+                ),
+            ))
+            session.headers["Content-Type"] = "application/json"
+            if BOT_TOKEN:
+                session.headers["Authorization"] = f"Bot {BOT_TOKEN}"
+            _session = session
+    return _session
+
+# Discord DM channel IDs are stable per user, so cache them (keyed by user ID)
+# to skip the create-DM round trip. Persisted across sessions, loaded lazily.
+DM_CHANNEL_CACHE_FILE = CACHE_DIR / "dm_channels.json"
+_DM_CHANNEL_CACHE: dict[str, str] = {}
+_dm_cache_loaded = False
+_dm_cache_lock = threading.Lock()
+
+# Upper bound on concurrent sends when fanning out to several recipients
+MAX_SEND_WORKERS = 8
+
+# Serializes status prints from worker threads so lines don't interleave
+_print_lock = threading.Lock()
+
+
+def _print(*args, **kwargs):
+    with _print_lock:
+        print(*args, **kwargs)
+
+
+def _load_dm_channel_cache() -> dict[str, str]:
+    """Return the DM channel cache, reading it from disk on first use."""
+    global _dm_cache_loaded
+    if not _dm_cache_loaded:
+        try:
+            _DM_CHANNEL_CACHE.update(json.loads(DM_CHANNEL_CACHE_FILE.read_text()))
+        except (OSError, ValueError):
+            pass
+        _dm_cache_loaded = True
+    return _DM_CHANNEL_CACHE
+
 
-# Slack configuration
-SLACK_TOKEN = os.getenv("SLACK_BOT_TOKEN")
+def _save_dm_channel_cache():
+    """Write the DM channel cache to disk."""
+    try:
+        _atomic_write_text(DM_CHANNEL_CACHE_FILE, json.dumps(_DM_CHANNEL_CACHE))
+    except OSError:
+        pass  # Cache is an optimization; never fail a send over it
+
+
+def _get_dm_channel(user_id: str, refresh: bool = False) -> str:
+    """Return the DM channel ID for a Discord user, creating it on cache miss."""
+    with _dm_cache_lock:
+        cached = _load_dm_channel_cache().get(user_id)
+    if cached and not refresh:
+        return cached
 
-# Build Slack channel map from env: SLACK_CHANNEL_<NAME>=<ID>
-SLACK_CHANNELS = {
-    m.group(1).lower(): v
-    for k, v in os.environ.items()
-    if (m := re.match(r"SLACK_CHANNEL_([A-Z0-9_-]+)", k, re.IGNORECASE))
-}
+    dm_response = _get_session().post(
+        f"{DISCORD_API}/users/@me/channels",
+        json={"recipient_id": user_id},
+        timeout=HTTP_TIMEOUT,
+    )
+    dm_response.raise_for_status()
+    dm_channel_id = dm_response.json()["id"]
 
-# Build Slack user map from env: SLACK_USER_<USERNAME>=<ID>
-SLACK_USERS = {
-    m.group(1).lower(): v
-    for k, v in os.environ.items()
-    if (m := re.match(r"SLACK_USER_([A-Z0-9_-]+)", k, re.IGNORECASE))
-}
+    with _dm_cache_lock:
+        _DM_CHANNEL_CACHE[user_id] = dm_channel_id
+        _save_dm_channel_cache()
+    return dm_channel_id
+
+
+# Slack configuration
+SLACK_TOKEN = os.getenv("SLACK_BOT_TOKEN")
 
 # SMTP configuration
 SMTP_HOST = os.getenv("SMTP_HOST", "smtp.resend.com")
@@ -109,11 +234,11 @@ def _resolve_discord_users(raw: str | list[str] | None) -> list[tuple[str, str]]
     for item in _to_list(raw):
         if item.isdigit():
             results.append((item, item))
-        elif item.lower() in USERS:
-            results.append((item, USERS[item.lower()]))
+        elif (user_id := USERS.get(item.lower())) is not None:
+            results.append((item, user_id))
         else:
             available = ", ".join(USERS.keys()) if USERS else "None"
-            print(f"❌ Discord: unknown user '{item}'. Available: {available}")
+            _print(f"❌ Discord: unknown user '{item}'. Available: {available}")
     return results
 
 
@@ -126,11 +251,11 @@ def _resolve_slack_users(raw: str | list[str] | None) -> list[tuple[str, str]]:
     for item in _to_list(raw):
         if item.startswith("U") and len(item) > 1 and item[1:].isalnum():
             results.append((item, item))
-        elif item.lower() in SLACK_USERS:
-            results.append((item, SLACK_USERS[item.lower()]))
+        elif (user_id := SLACK_USERS.get(item.lower())) is not None:
+            results.append((item, user_id))
         else:
             available = ", ".join(SLACK_USERS.keys()) if SLACK_USERS else "None"
-            print(f"❌ Slack: unknown user '{item}'. Available: {available}")
+            _print(f"❌ Slack: unknown user '{item}'. Available: {available}")
     return results
 
 
@@ -143,11 +268,11 @@ def _resolve_emails(raw: str | list[str] | None) -> list[tuple[str, str]]:
     for item in _to_list(raw):
         if "@" in item:
             results.append((item, item))
-        elif item.lower() in EMAIL_RECIPIENTS:
-            results.append((item, EMAIL_RECIPIENTS[item.lower()]))
+        elif (addr := EMAIL_RECIPIENTS.get(item.lower())) is not None:
+            results.append((item, addr))
         else:
             available = ", ".join(EMAIL_RECIPIENTS.keys()) if EMAIL_RECIPIENTS else "None"
-            print(f"❌ Email: unknown user '{item}'. Available: {available}")
+            _print(f"❌ Email: unknown user '{item}'. Available: {available}")
     return results
 
 
@@ -209,37 +334,51 @@ def send_discord_dm(message: str, user: str | list[str] | None = None):
     user = user or config.discord_user
 
     if not BOT_TOKEN:
-        print("❌ Discord: BOT_TOKEN not configured")
+        _print("❌ Discord: BOT_TOKEN not configured")
         return False
 
     resolved = _resolve_discord_users(user)
     if not resolved:
-        print("❌ Discord: No valid users for DM")
+        _print("❌ Discord: No valid users for DM")
         return False
 
-    success_count = 0
-    dm_headers = {"Authorization": f"Bot {BOT_TOKEN}", "Content-Type": "application/json"}
+    # Multi-user sends go through aiohttp when it's installed: one event loop
+    # instead of a thread per recipient. Callers already inside an event loop
+    # (e.g. Jupyter) stay on the thread pool below.
+    if len(resolved) > 1:
+        from measurebot import alerts_async
+        if alerts_async.can_run():
+            return alerts_async.deliver_discord_dms(message, resolved)
 
-    for label, user_id in resolved:
-        try:
-            dm_response = requests.post(
-                "https://discord.com/api/v10/users/@me/channels",
-                headers=dm_headers,
-                json={"recipient_id": user_id},
-            )
-            dm_response.raise_for_status()
-            dm_channel_id = dm_response.json()["id"]
+    requests = _get_requests()
+    session = _get_session()
 
-            msg_response = requests.post(
-                f"https://discord.com/api/v10/channels/{dm_channel_id}/messages",
-                headers=dm_headers,
+    def _send_one(label, user_id):
+        try:
+            dm_channel_id = _get_dm_channel(user_id)
+            msg_response = session.post(
+                f"{DISCORD_API}/channels/{dm_channel_id}/messages",
                 json={"content": message},
+                timeout=HTTP_TIMEOUT,
             )
+            if msg_response.status_code == 404:
+                # Cached channel is gone; recreate it and retry once
+                dm_channel_id = _get_dm_channel(user_id, refresh=True)
+                msg_response = session.post(
+                    f"{DISCORD_API}/channels/{dm_channel_id}/messages",
+                    json={"content": message},
+                    timeout=HTTP_TIMEOUT,
+                )
             msg_response.raise_for_status()
-            print(f"✅ Discord DM: sent to @{label}")
-            success_count += 1
+            _print(f"✅ Discord DM: sent to @{label}")
+            return True
         except requests.exceptions.RequestException as e:
-            print(f"❌ Discord DM: failed to send to @{label} - {e}")
+            _print(f"❌ Discord DM: failed to send to @{label} - {e}")
+            return False
+
+    with ThreadPoolExecutor(max_workers=min(MAX_SEND_WORKERS, len(resolved))) as pool:
+        futures = [pool.submit(_send_one, label, user_id) for label, user_id in resolved]
+        success_count = sum(f.result() for f in as_completed(futures))
 
     return success_count == len(resolved)
 
@@ -256,54 +395,61 @@ def send_discord_channel_message(message: str, channel: str | None = None, user:
     user = user or config.discord_user
 
     if not BOT_TOKEN:
-        print("❌ Discord: BOT_TOKEN not configured")
+        _print("❌ Discord: BOT_TOKEN not configured")
         return False
-    if channel not in CHANNELS:
+    channel_id = CHANNELS.get(channel)
+    if channel_id is None:
         available = ", ".join(CHANNELS.keys()) if CHANNELS else "None"
-        print(f"❌ Discord: channel '{channel}' not found. Available: {available}")
+        _print(f"❌ Discord: channel '{channel}' not found. Available: {available}")
         return False
 
-    channel_id = CHANNELS[channel]
-    headers = {"Authorization": f"Bot {BOT_TOKEN}", "Content-Type": "application/json"}
-
     resolved = _resolve_discord_users(user)
 
-    if resolved:
-        mentions = [f"<@{uid}>" for _, uid in resolved]
-        labels = [label for label, _ in resolved]
-        full_message = f"{' '.join(mentions)} {message}"
+    ids, labels, mentions = [], [], []
+    for label, uid in resolved:
+        ids.append(uid)
+        labels.append(label)
+        mentions.append(f"<@{uid}>")
+
+    if mentions:
         payload = {
-            "content": full_message,
-            "allowed_mentions": {"users": [uid for _, uid in resolved]}
+            "content": f"{' '.join(mentions)} {message}",
+            "allowed_mentions": {"users": ids}
         }
     else:
         payload = {"content": message}
 
     try:
-        r = requests.post(
-            f"https://discord.com/api/v10/channels/{channel_id}/messages",
-            headers=headers, json=payload,
+        r = _get_session().post(
+            f"{DISCORD_API}/channels/{channel_id}/messages",
+            json=payload, timeout=HTTP_TIMEOUT,
         )
         r.raise_for_status()
         if resolved:
-            print(f"✅ Discord: sent to #{channel} (mentioning {', '.join(f'@{l}' for l in labels)})")
+            _print(f"✅ Discord: sent to #{channel} (mentioning {', '.join(f'@{l}' for l in labels)})")
         else:
-            print(f"✅ Discord: sent to #{channel}")
+            _print(f"✅ Discord: sent to #{channel}")
         return True
     except Exception as e:
-        print(f"❌ Discord: failed to send to #{channel} - {e}")
+        _print(f"❌ Discord: failed to send to #{channel} - {e}")
         return False
 
 
-def send_email(message: str, subject: str = "MeasureBot Notification", to_user: str | list[str] | None = None, to_email: str | list[str] | None = None, from_email: str | None = None):
+def send_email(message: str, subject: str = "MeasureBot Notification", to_user: str | list[str] | None = None, to_email: str | list[str] | None = None, from_email: str | None = None, per_recipient: bool = False):
     """Send an email notification via SMTP.
 
+    By default all recipients share one message (one SMTP transaction),
+    addressed To: the sender with the recipients in Bcc so no one sees the
+    other addresses. Pass per_recipient=True to send each address its own
+    message, addressed To: it, instead.
+
     Args:
         message: Email message content
         subject: Email subject line
         to_user: Registry name(s) or raw email address(es)
         to_email: Direct email address(es) (merged with to_user)
         from_email: Sender email (defaults to EMAIL_FROM)
+        per_recipient: Send a separate message to each recipient
     """
     from_addr = from_email or EMAIL_FROM
     to_user = to_user or config.email_user
@@ -326,39 +472,58 @@ def send_email(message: str, subject: str = "MeasureBot Notification", to_user:
         to_addresses = []
 
     if not SMTP_PASS:
-        print("❌ Email: SMTP_PASS not configured")
+        _print("❌ Email: SMTP_PASS not configured")
         return False
     if not from_addr:
-        print("❌ Email: EMAIL_FROM not configured")
+        _print("❌ Email: EMAIL_FROM not configured")
         return False
     if not to_addresses:
-        print("❌ Email: no recipients specified and no default EMAIL_TO")
+        _print("❌ Email: no recipients specified and no default EMAIL_TO")
         return False
 
-    success_count = 0
+    import smtplib
+    from email.message import EmailMessage
 
-    for to_addr in to_addresses:
-        msg = MIMEMultipart()
-        msg["From"] = from_addr
-        msg["To"] = to_addr
-        msg["Subject"] = subject
-        msg.attach(MIMEText(message, "plain"))
+    success_count = 0
 
-        try:
-            with smtplib.SMTP(SMTP_HOST, SMTP_PORT) as server:
-                server.starttls()
-                server.login(SMTP_USER, SMTP_PASS)
-                server.send_message(msg)
-            success_count += 1
-        except Exception as e:
-            print(f"❌ Email: failed to send to {to_addr} - {e}")
+    try:
+        with smtplib.SMTP(SMTP_HOST, SMTP_PORT) as server:
+            server.starttls()
+            server.login(SMTP_USER, SMTP_PASS)
+            if per_recipient:
+                batches = [[to_addr] for to_addr in to_addresses]
+            else:
+                batches = [to_addresses]
+
+            for batch in batches:
+                msg = EmailMessage()
+                msg["From"] = from_addr
+                if len(batch) == 1:
+                    msg["To"] = batch[0]
+                else:
+                    # send_message() strips Bcc before sending; to_addrs carries the envelope
+                    msg["To"] = from_addr
+                    msg["Bcc"] = ", ".join(batch)
+                msg["Subject"] = subject
+                msg.set_content(message)
+
+                # A refused address shouldn't abort the rest of the batch
+                try:
+                    refused = server.send_message(msg, from_addr=from_addr, to_addrs=batch)
+                    success_count += len(batch) - len(refused)
+                    for to_addr, err in refused.items():
+                        _print(f"❌ Email: failed to send to {to_addr} - {err}")
+                except (smtplib.SMTPRecipientsRefused, smtplib.SMTPResponseException) as e:
+                    _print(f"❌ Email: failed to send to {', '.join(batch)} - {e}")
+    except Exception as e:
+        _print(f"❌ Email: failed to send - {e}")
 
     if success_count > 0:
         total_count = len(to_addresses)
         if total_count == 1:
-            print(f"✅ Email: sent to {to_addresses[0]}")
+            _print(f"✅ Email: sent to {to_addresses[0]}")
         else:
-            print(f"✅ Email: sent to {success_count}/{total_count} recipients ({', '.join(to_addresses[:3])}{'...' if len(to_addresses) > 3 else ''})")
+            _print(f"✅ Email: sent to {success_count}/{total_count} recipients ({', '.join(to_addresses[:3])}{'...' if len(to_addresses) > 3 else ''})")
         return success_count == total_count
     else:
         return False
@@ -375,14 +540,15 @@ def send_slack_dm(message: str, user: str | list[str] | None = None):
     user = user or config.slack_user
 
     if not SLACK_TOKEN:
-        print("❌ Slack: SLACK_BOT_TOKEN not configured")
+        _print("❌ Slack: SLACK_BOT_TOKEN not configured")
         return False
 
     resolved = _resolve_slack_users(user)
     if not resolved:
-        print("❌ Slack: No valid users for DM")
+        _print("❌ Slack: No valid users for DM")
         return False
 
+    requests = _get_requests()
     success_count = 0
     headers = {
         "Authorization": f"Bearer {SLACK_TOKEN}",
@@ -399,7 +565,7 @@ def send_slack_dm(message: str, user: str | list[str] | None = None):
             open_data = open_resp.json()
 
             if not open_data.get("ok"):
-                print(f"❌ Slack DM: failed to open channel with @{label} - {open_data.get('error', 'Unknown error')}")
+                _print(f"❌ Slack DM: failed to open channel with @{label} - {open_data.get('error', 'Unknown error')}")
                 continue
 
             dm_channel_id = open_data["channel"]["id"]
@@ -412,13 +578,13 @@ def send_slack_dm(message: str, user: str | list[str] | None = None):
             send_data = send_resp.json()
 
             if send_data.get("ok"):
-                print(f"✅ Slack DM: sent to @{label}")
+                _print(f"✅ Slack DM: sent to @{label}")
                 success_count += 1
             else:
-                print(f"❌ Slack DM: failed to send to @{label} - {send_data.get('error', 'Unknown error')}")
+                _print(f"❌ Slack DM: failed to send to @{label} - {send_data.get('error', 'Unknown error')}")
 
         except requests.exceptions.RequestException as e:
-            print(f"❌ Slack DM: failed to send to @{label} - {e}")
+            _print(f"❌ Slack DM: failed to send to @{label} - {e}")
 
     return success_count == len(resolved)
 
@@ -435,24 +601,24 @@ def send_slack_channel_message(message: str, channel: str | None = None, user: s
     user = user or config.slack_user
 
     if not SLACK_TOKEN:
-        print("❌ Slack: SLACK_BOT_TOKEN not configured")
+        _print("❌ Slack: SLACK_BOT_TOKEN not configured")
         return False
-    if channel not in SLACK_CHANNELS:
+    channel_id = SLACK_CHANNELS.get(channel)
+    if channel_id is None:
         available = ", ".join(SLACK_CHANNELS.keys()) if SLACK_CHANNELS else "None"
-        print(f"❌ Slack: channel '{channel}' not found. Available: {available}")
+        _print(f"❌ Slack: channel '{channel}' not found. Available: {available}")
         return False
 
-    channel_id = SLACK_CHANNELS[channel]
     headers = {"Authorization": f"Bearer {SLACK_TOKEN}", "Content-Type": "application/json"}
 
     resolved = _resolve_slack_users(user)
 
-    if resolved:
-        mentions = [f"<@{uid}>" for _, uid in resolved]
-        labels = [label for label, _ in resolved]
-        full_message = f"{' '.join(mentions)} {message}"
-    else:
-        full_message = message
+    labels, mentions = [], []
+    for label, uid in resolved:
+        labels.append(label)
+        mentions.append(f"<@{uid}>")
+
+    full_message = f"{' '.join(mentions)} {message}" if mentions else message
 
     payload = {
         "channel": channel_id,
@@ -460,7 +626,7 @@ def send_slack_channel_message(message: str, channel: str | None = None, user: s
     }
 
     try:
-        r = requests.post(
+        r = _get_requests().post(
             "https://slack.com/api/chat.postMessage",
             headers=headers, json=payload,
         )
@@ -469,15 +635,15 @@ def send_slack_channel_message(message: str, channel: str | None = None, user: s
 
         if response_data.get("ok"):
             if resolved:
-                print(f"✅ Slack: sent to #{channel} (mentioning {', '.join(f'@{l}' for l in labels)})")
+                _print(f"✅ Slack: sent to #{channel} (mentioning {', '.join(f'@{l}' for l in labels)})")
             else:
-                print(f"✅ Slack: sent to #{channel}")
+                _print(f"✅ Slack: sent to #{channel}")
             return True
         else:
-            print(f"❌ Slack: failed to send to #{channel} - {response_data.get('error', 'Unknown error')}")
+            _print(f"❌ Slack: failed to send to #{channel} - {response_data.get('error', 'Unknown error')}")
             return False
     except Exception as e:
-        print(f"❌ Slack: failed to send to #{channel} - {e}")
+        _print(f"❌ Slack: failed to send to #{channel} - {e}")
         return False
 
 
@@ -532,10 +698,15 @@ def email(message: str, subject: str = "MeasureBot Notification", to_user: str |
 
 
 def alert(message: str, subject: str = "MeasureBot Alert"):
-    """Send Discord DM, Slack, and email notifications using defaults."""
-    discord_ok = send_discord_message(message)
-    slack_ok = send_slack_message(message)
-    email_ok = send_email(message, subject)
+    """Send Discord DM, Slack, and email notifications using defaults.
+
+    The three go to independent servers, so they are sent concurrently.
+    """
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        discord_f = pool.submit(send_discord_message, message)
+        slack_f = pool.submit(send_slack_message, message)
+        email_f = pool.submit(send_email, message, subject)
+        discord_ok, slack_ok, email_ok = discord_f.result(), slack_f.result(), email_f.result()
     return discord_ok and slack_ok and email_ok
 
 
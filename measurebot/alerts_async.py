@@ -0,0 +1,135 @@
+"""Async Discord delivery for high fan-out alerts.
+
+Sends DMs to many users concurrently over a single ``aiohttp`` session
+driven by one event loop, instead of a thread per recipient.
+
+Requires the ``aiohttp`` package::
+
+    pip install aiohttp
+
+``measurebot.alerts.send_discord_dm`` uses this automatically for
+multi-user sends when aiohttp is installed and no event loop is already
+running (e.g. plain scripts, not Jupyter).
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None  # type: ignore[assignment]
+
+from measurebot import alerts
+
+# Max DMs in flight at once
+MAX_CONCURRENCY = 8
+
+# Rate limits only: a 5xx on a POST may already have created the message
+_RETRY_STATUSES = {429}
+_RETRY_ATTEMPTS = 3
+_RETRY_BACKOFF = 0.3
+
+
+def can_run() -> bool:
+    """True if aiohttp is installed and no event loop is running in this thread."""
+    if aiohttp is None:
+        return False
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return True
+    return False
+
+
+async def _post(session, url: str, payload: dict):
+    """POST, retrying rate limits like the requests session in alerts."""
+    for attempt in range(_RETRY_ATTEMPTS + 1):
+        resp = await session.post(url, json=payload)
+        if resp.status not in _RETRY_STATUSES or attempt == _RETRY_ATTEMPTS:
+            return resp
+        retry_after = resp.headers.get("Retry-After")
+        resp.release()
+        await asyncio.sleep(float(retry_after) if retry_after else _RETRY_BACKOFF * 2 ** attempt)
+
+
+async def _get_dm_channel(session, user_id: str, refresh: bool = False) -> str:
+    with alerts._dm_cache_lock:
+        cached = alerts._load_dm_channel_cache().get(user_id)
+    if cached and not refresh:
+        return cached
+
+    resp = await _post(session, f"{alerts.DISCORD_API}/users/@me/channels", {"recipient_id": user_id})
+    resp.raise_for_status()
+    dm_channel_id = (await resp.json())["id"]
+
+    with alerts._dm_cache_lock:
+        alerts._DM_CHANNEL_CACHE[user_id] = dm_channel_id
+        alerts._save_dm_channel_cache()
+    return dm_channel_id
+
+
+async def _send_one(session, sem: asyncio.Semaphore, message: str, label: str, user_id: str) -> bool:
+    async with sem:
+        try:
+            dm_channel_id = await _get_dm_channel(session, user_id)
+            url = f"{alerts.DISCORD_API}/channels/{dm_channel_id}/messages"
+            resp = await _post(session, url, {"content": message})
+            if resp.status == 404:
+                # Cached channel is gone; recreate it and retry once
+                resp.release()
+                dm_channel_id = await _get_dm_channel(session, user_id, refresh=True)
+                url = f"{alerts.DISCORD_API}/channels/{dm_channel_id}/messages"
+                resp = await _post(session, url, {"content": message})
+            resp.raise_for_status()
+            resp.release()
+            alerts._print(f"✅ Discord DM: sent to @{label}")
+            return True
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            alerts._print(f"❌ Discord DM: failed to send to @{label} - {e}")
+            return False
+
+
+async def _deliver(message: str, resolved: list[tuple[str, str]]) -> bool:
+    connect, read = alerts.HTTP_TIMEOUT
+    sem = asyncio.Semaphore(MAX_CONCURRENCY)
+    async with aiohttp.ClientSession(
+        headers={"Authorization": f"Bot {alerts.BOT_TOKEN}", "Content-Type": "application/json"},
+        timeout=aiohttp.ClientTimeout(connect=connect, sock_read=read),
+    ) as session:
+        results = await asyncio.gather(
+            *(_send_one(session, sem, message, label, user_id) for label, user_id in resolved),
+            return_exceptions=True,
+        )
+    return all(r is True for r in results)
+
+
+def deliver_discord_dms(message: str, resolved: list[tuple[str, str]]) -> bool:
+    """Send a DM to already-resolved (label, user_id) pairs. Blocks until done."""
+    return asyncio.run(_deliver(message, resolved))
+
+
+async def send_discord_dm_async(message: str, user: str | list[str] | None = None) -> bool:
+    """Send a Discord direct message to user(s) concurrently.
+
+    Args:
+        message: Message to send
+        user: Registry name(s) or raw Discord user ID(s)
+    """
+    if aiohttp is None:
+        raise ImportError(
+            "aiohttp is required for async delivery. Install with: pip install aiohttp"
+        )
+    user = user or alerts.config.discord_user
+
+    if not alerts.BOT_TOKEN:
+        alerts._print("❌ Discord: BOT_TOKEN not configured")
+        return False
+
+    resolved = alerts._resolve_discord_users(user)
+    if not resolved:
+        alerts._print("❌ Discord: No valid users for DM")
+        return False
+
+    return await _deliver(message, resolved)
@@ -13,8 +13,10 @@ Back-UPS USB family (VID 0x051D, PID 0x0002).
 
 from __future__ import annotations
 
+import functools
+import math
 import time
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from typing import Any
 
 try:
@@ -26,24 +28,29 @@ APC_VID = 0x051D
 APC_PID = 0x0002
 
 # HID feature report definitions
-# Report ID -> (human name, byte count after ID, decode function name)
+# Report ID -> (field name, payload width in bytes; 2 = uint16 LE, 1 = uint8)
 _REPORTS = {
-    0x22: "charge_pct",
-    0x23: "runtime_sec",
-    0x26: "battery_voltage_raw",
-    0x25: "battery_nominal_voltage_raw",
-    0x31: "input_voltage",
-    0x30: "input_nominal_voltage",
-    0x32: "low_transfer_voltage",
-    0x33: "high_transfer_voltage",
-    0x16: "status_raw",
-    0x36: "last_transfer_cause",
-    0x35: "sensitivity",
-    0x21: "self_test_result",
+    0x22: ("charge_pct", 1),
+    0x23: ("runtime_sec", 2),
+    0x26: ("battery_voltage_raw", 2),
+    0x25: ("battery_nominal_voltage_raw", 2),
+    0x31: ("input_voltage", 2),
+    0x30: ("input_nominal_voltage", 1),
+    0x32: ("low_transfer_voltage", 2),
+    0x33: ("high_transfer_voltage", 2),
+    0x16: ("status_raw", 1),
+    0x36: ("last_transfer_cause", 1),
+    0x35: ("sensitivity", 1),
+    0x21: ("self_test_result", 1),
 }
 
-# Reports that decode as uint16 LE (all others are uint8)
-_U16_REPORTS = {0x23, 0x26, 0x25, 0x31, 0x32, 0x33}
+
+def _decode(width: int, data: list[int]) -> int:
+    """Decode a feature report payload (byte 0 is the report ID)."""
+    if width == 2:
+        return data[1] | (data[2] << 8) if len(data) >= 3 else 0
+    return data[1] if len(data) >= 2 else 0
+
 
 TRANSFER_CAUSES = {
     0: "No transfer",
@@ -91,11 +98,12 @@ class UPSStatus:
     def on_battery(self) -> bool:
         return not self.ac_present
 
-    @property
+    # Derived values are cached on first access; a snapshot isn't modified after read()
+    @functools.cached_property
     def runtime_min(self) -> float:
         return self.runtime_sec / 60.0
 
-    @property
+    @functools.cached_property
     def status_str(self) -> str:
         if not self.ac_present:
             return "ON BATTERY"
@@ -103,12 +111,24 @@ class UPSStatus:
             return "ONLINE"
         return "ONLINE (charging)"
 
-    @property
+    @functools.cached_property
     def transfer_cause_str(self) -> str:
         return TRANSFER_CAUSES.get(self.last_transfer_cause, f"Unknown ({self.last_transfer_cause})")
 
+    @property
+    def state_key(self) -> tuple[bool, int, str, int, str]:
+        """The values oneliner() prints, as it rounds them; equal keys render the same line."""
+        return (
+            self.ac_present,
+            self.charge_pct,
+            f"{self.runtime_min:.0f}",
+            self.input_voltage,
+            f"{self.battery_voltage:.1f}",
+        )
+
     def to_dict(self) -> dict[str, Any]:
-        d = asdict(self)
+        # All fields are primitives, so a shallow copy is enough (asdict deep-copies)
+        d = self.__dict__.copy()
         d["on_battery"] = self.on_battery
         d["runtime_min"] = self.runtime_min
         d["status_str"] = self.status_str
@@ -116,15 +136,14 @@ class UPSStatus:
         return d
 
     def summary(self) -> str:
-        lines = [
-            f"Status:    {self.status_str}",
-            f"Charge:    {self.charge_pct}%",
-            f"Runtime:   {self.runtime_min:.1f} min ({self.runtime_sec} sec)",
-            f"Batt V:    {self.battery_voltage:.2f}V (nominal {self.battery_nominal_voltage:.2f}V)",
-            f"Input V:   {self.input_voltage}V (nominal {self.input_nominal_voltage}V)",
-            f"Transfer:  {self.low_transfer_voltage}V low / {self.high_transfer_voltage}V high",
-        ]
-        return "\n".join(lines)
+        return (
+            f"Status:    {self.status_str}\n"
+            f"Charge:    {self.charge_pct}%\n"
+            f"Runtime:   {self.runtime_min:.1f} min ({self.runtime_sec} sec)\n"
+            f"Batt V:    {self.battery_voltage:.2f}V (nominal {self.battery_nominal_voltage:.2f}V)\n"
+            f"Input V:   {self.input_voltage}V (nominal {self.input_nominal_voltage}V)\n"
+            f"Transfer:  {self.low_transfer_voltage}V low / {self.high_transfer_voltage}V high"
+        )
 
     def oneliner(self) -> str:
         state = "BATT" if self.on_battery else "AC"
@@ -146,9 +165,12 @@ class UPSReader:
 
         with UPSReader() as reader:
             status = reader.read()
+
+    Reads within ``min_interval_s`` of the previous one return the cached
+    snapshot instead of re-querying the device; pass ``force=True`` to bypass.
     """
 
-    def __init__(self, vid: int = APC_VID, pid: int = APC_PID) -> None:
+    def __init__(self, vid: int = APC_VID, pid: int = APC_PID, min_interval_s: float = 1.0) -> None:
         if hid is None:
             raise ImportError(
                 "hidapi is required for UPS monitoring. Install with: pip install hidapi"
@@ -158,6 +180,9 @@ class UPSReader:
         self._dev: hid.device | None = None
         self.product: str = ""
         self.serial: str = ""
+        self.min_interval_s = min_interval_s
+        self._last_read: UPSStatus | None = None
+        self._last_t: float = 0.0
 
     def open(self) -> None:
         """Open the HID device."""
@@ -172,6 +197,7 @@ class UPSReader:
         if self._dev is not None:
             self._dev.close()
             self._dev = None
+        self._last_read = None
 
     def __enter__(self) -> UPSReader:
         self.open()
@@ -186,15 +212,33 @@ class UPSReader:
             raise RuntimeError("UPS device not open")
         return self._dev.get_feature_report(report_id, 8)
 
-    def read(self) -> UPSStatus:
-        """Read all status reports and return decoded status."""
-        raw: dict[str, int] = {}
-        for report_id, name in _REPORTS.items():
-            data = self._feat(report_id)
-            if report_id in _U16_REPORTS:
-                raw[name] = data[1] | (data[2] << 8) if len(data) >= 3 else 0
-            else:
-                raw[name] = data[1] if len(data) >= 2 else 0
+    def wait_for_event(self, timeout: float) -> bool:
+        """Block until the UPS sends an input report or ``timeout`` seconds pass.
+
+        APC units push an interrupt-in report when their status changes (AC
+        lost/restored, charge step). Returns True if one arrived, False on
+        timeout. The report is discarded; call read() for the decoded status.
+        """
+        if self._dev is None:
+            raise RuntimeError("UPS device not open")
+        # hidapi treats 0 ms as "block forever" on a blocking handle, so never
+        # round a short timeout down to it
+        return bool(self._dev.read(64, max(1, math.ceil(timeout * 1000))))
+
+    def read(self, *, force: bool = False) -> UPSStatus:
+        """Read all status reports and return decoded status.
+
+        Returns the previous snapshot if it is younger than ``min_interval_s``,
+        unless ``force`` is set.
+        """
+        if (
+            not force
+            and self._last_read is not None
+            and time.monotonic() - self._last_t < self.min_interval_s
+        ):
+            return self._last_read
+
+        raw = {name: _decode(width, self._feat(report_id)) for report_id, (name, width) in _REPORTS.items()}
 
         status_byte = raw["status_raw"]
         # Bit 0 of the status byte tracks "charging", not "AC present".
@@ -205,7 +249,7 @@ class UPSReader:
         ac_present = input_v > 0
         charging = bool(status_byte & 0x01)
 
-        return UPSStatus(
+        status = UPSStatus(
             ac_present=ac_present,
             charging=charging,
             charge_pct=raw["charge_pct"],
@@ -221,3 +265,6 @@ class UPSReader:
             sensitivity=raw["sensitivity"],
             self_test_result=raw["self_test_result"],
         )
+        self._last_read = status
+        self._last_t = time.monotonic()
+        return status
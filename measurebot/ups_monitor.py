@@ -12,6 +12,7 @@ Usage::
 
     # Daemon mode with CLI overrides
     python -m measurebot.ups_monitor --daemon --config ups_monitor.json --poll-interval 10
+    python -m measurebot.ups_monitor --daemon --config ups_monitor.json --poll-interval-battery 2
 
     # JSON output (single read)
     python -m measurebot.ups_monitor --json
@@ -20,6 +21,9 @@ Config file example (JSON)::
 
     {
         "poll_interval": 30,
+        "poll_interval_on_battery": 5,
+        "poll_interval_critical": 1,
+        "state_path": "~/.cache/measurebot/ups_state.json",
         "notify": {
             "email": ["aaron@aaronsharpe.science", "zack.gomez@gmail.com"],
             "slack_users": ["asharpe", "zack"],
@@ -51,19 +55,76 @@ Routing (who to notify) goes in the config file, not .env.
 from __future__ import annotations
 
 import argparse
+import atexit
+import functools
 import json
 import logging
+import logging.handlers
+import math
+import os
+import queue
+import select
+import signal
+import statistics
 import sys
+import threading
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 
 from measurebot.ups import UPSReader, UPSStatus
 
-log = logging.getLogger("measurebot.ups_monitor")
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
+log = logging.getLogger("measurebot.ups_monitor")
 
-@dataclass
+# Compact JSON encoder, built once and reused for status output and state
+_JSON = json.JSONEncoder(separators=(",", ":"), default=str).encode
+
+# Repeated warn/crit alerts within this window are sent once, and power
+# changes beyond the first FLAP_ALERTS in it are summarised in one alert
+ALERT_COOLDOWN_SEC = 60
+FLAP_ALERTS = 2
+# Outages up to this long are reported as one "brief outage" alert. power_lost
+# is held for this plus the time debounce needs to confirm the restore
+BRIEF_OUTAGE_SEC = 5
+# Events waiting for the callback thread before new ones are dropped
+EVENT_QUEUE_SIZE = 32
+# On shutdown, longest wait for queued events to reach the alerter
+SHUTDOWN_FLUSH_SEC = 10
+# Battery readings the charge thresholds are judged on (median)
+CHARGE_WINDOW = 10
+# Recent delivery times kept per channel for ordering sends
+LATENCY_WINDOW = 5
+# Consecutive read failures before the USB handle is closed and reopened
+READ_FAILS_BEFORE_REOPEN = 3
+# Cap on the retry backoff after read failures
+MAX_BACKOFF_SEC = 300
+# UPSMonitor._flags bits
+_SEEN = 1 << 0  # at least one confirmed reading
+_AC = 1 << 1  # AC present on that reading
+_WARN = 1 << 2  # battery_warn fired this outage
+_CRIT = 1 << 3  # battery_crit fired this outage
+
+# Events reported by _decide()
+_EV_LOST = 1 << 0
+_EV_RESTORED = 1 << 1
+_EV_WARN = 1 << 2
+_EV_CRIT = 1 << 3
+_EV_UPDATE = 1 << 4
+
+# Monitor state survives daemon restarts here (see UPSMonitor)
+STATE_FILE = Path.home() / ".cache" / "measurebot" / "ups_state.json"
+# Slack on top of the poll interval before a missing reading counts as a stall
+READ_STALL_SEC = 2
+
+
+@dataclass(frozen=True, slots=True)
 class ThresholdConfig:
     """Thresholds for a single alert level (warn or crit)."""
 
@@ -71,19 +132,53 @@ class ThresholdConfig:
     on_battery_min: float | None = None
     runtime_min: float | None = None
 
-    def any_set(self) -> bool:
-        return any(v is not None for v in (self.battery_pct, self.on_battery_min, self.runtime_min))
+    # Comparison-ready values in whole seconds, computed once since check()
+    # runs every poll; runtime compares directly against status.runtime_sec
+    _on_battery_sec: int | None = field(default=None, init=False, repr=False, compare=False)
+    _runtime_sec: int | None = field(default=None, init=False, repr=False, compare=False)
+    _any: bool = field(default=False, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.on_battery_min is not None:
+            object.__setattr__(self, "_on_battery_sec", int(self.on_battery_min * 60))
+        if self.runtime_min is not None:
+            object.__setattr__(self, "_runtime_sec", int(self.runtime_min * 60))
+        object.__setattr__(
+            self, "_any", any(v is not None for v in (self.battery_pct, self.on_battery_min, self.runtime_min))
+        )
 
-    def check(self, status: UPSStatus, on_battery_sec: float) -> str | None:
-        """Check if any threshold is breached. Returns reason string or None."""
-        if self.battery_pct is not None and status.charge_pct <= self.battery_pct:
-            return f"charge {status.charge_pct}% <= {self.battery_pct}%"
-        if self.on_battery_min is not None and on_battery_sec >= self.on_battery_min * 60:
+    def any_set(self) -> bool:
+        return self._any
+
+    def check(self, status: UPSStatus, on_battery_sec: float, charge_pct: int | None = None) -> str | None:
+        """Check if any threshold is breached. Returns reason string or None.
+
+        ``charge_pct`` overrides the status's own reading (e.g. a smoothed one).
+        """
+        if not self._any:
+            return None
+        if charge_pct is None:
+            charge_pct = status.charge_pct
+        if self.battery_pct is not None and charge_pct <= self.battery_pct:
+            return f"charge {charge_pct}% <= {self.battery_pct}%"
+        if self._on_battery_sec is not None and on_battery_sec >= self._on_battery_sec:
             return f"on battery {on_battery_sec / 60:.0f} min >= {self.on_battery_min} min"
-        if self.runtime_min is not None and status.runtime_min <= self.runtime_min:
+        if self._runtime_sec is not None and status.runtime_sec <= self._runtime_sec:
             return f"runtime {status.runtime_min:.0f} min <= {self.runtime_min} min"
         return None
 
+    def near(self, status: UPSStatus, on_battery_sec: float, margin: float = 1.5) -> bool:
+        """True if any threshold is within ``margin``x of being breached."""
+        if not self._any:
+            return False
+        if self.battery_pct is not None and status.charge_pct <= self.battery_pct * margin:
+            return True
+        if self._on_battery_sec is not None and on_battery_sec * margin >= self._on_battery_sec:
+            return True
+        if self._runtime_sec is not None and status.runtime_sec <= self._runtime_sec * margin:
+            return True
+        return False
+
     def summary(self) -> str:
         parts = []
         if self.battery_pct is not None:
@@ -95,7 +190,7 @@ class ThresholdConfig:
         return " / ".join(parts)
 
 
-@dataclass
+@dataclass(slots=True)
 class EventsConfig:
     """Which events to fire and their thresholds."""
 
@@ -136,7 +231,17 @@ class EventsConfig:
         return ", ".join(parts) if parts else "none"
 
 
-@dataclass
+def _as_list(value) -> list:
+    """Accept a single value or a list in config (e.g. one email address)."""
+    return value if isinstance(value, list) else [value]
+
+
+# Config keys copied straight onto the dataclass, per section
+_LIST_KEYS = ("email", "slack_users", "discord_users")
+_INTERVAL_KEYS = ("poll_interval", "poll_interval_on_battery", "poll_interval_critical")
+
+
+@dataclass(slots=True)
 class NotifyConfig:
     """Notification routing (who to alert, not credentials)."""
 
@@ -148,14 +253,11 @@ class NotifyConfig:
     @classmethod
     def from_dict(cls, data: dict) -> NotifyConfig:
         cfg = cls()
-        if "email" in data:
-            cfg.email = data["email"] if isinstance(data["email"], list) else [data["email"]]
-        if "slack_users" in data:
-            cfg.slack_users = data["slack_users"] if isinstance(data["slack_users"], list) else [data["slack_users"]]
+        for key in _LIST_KEYS:
+            if key in data:
+                setattr(cfg, key, _as_list(data[key]))
         if "slack_channel" in data:
             cfg.slack_channel = data["slack_channel"]
-        if "discord_users" in data:
-            cfg.discord_users = data["discord_users"] if isinstance(data["discord_users"], list) else [data["discord_users"]]
         return cfg
 
     def summary(self) -> str:
@@ -171,177 +273,787 @@ class NotifyConfig:
         return " | ".join(parts) if parts else "none"
 
 
-@dataclass
+@dataclass(slots=True)
 class MonitorConfig:
-    """Full monitor configuration."""
+    """Full monitor configuration.
+
+    ``poll_interval`` applies on AC power. While on battery the monitor polls
+    every ``poll_interval_on_battery`` seconds, dropping to
+    ``poll_interval_critical`` once a crit threshold is within 1.5x of firing.
+
+    Charge thresholds are judged on the median of the last ``CHARGE_WINDOW``
+    battery readings, so warn/crit can fire up to ``CHARGE_WINDOW // 2``
+    polls after the raw charge first crosses them.
+
+    ``state_path`` is where outage state is kept across restarts; None
+    disables it.
+    """
 
     poll_interval: float = 30
+    poll_interval_on_battery: float = 5
+    poll_interval_critical: float = 1
     notify: NotifyConfig = field(default_factory=NotifyConfig)
     events: EventsConfig = field(default_factory=EventsConfig)
+    state_path: Path | None = STATE_FILE
 
     @classmethod
     def from_file(cls, path: str | Path) -> MonitorConfig:
         """Load config from a JSON file."""
-        data = json.loads(Path(path).read_text())
+        raw = Path(path).read_bytes()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
         cfg = cls()
-        if "poll_interval" in data:
-            cfg.poll_interval = data["poll_interval"]
+        for key in _INTERVAL_KEYS:
+            if key in data:
+                setattr(cfg, key, data[key])
         if "notify" in data:
             cfg.notify = NotifyConfig.from_dict(data["notify"])
         if "events" in data:
             cfg.events = EventsConfig.from_dict(data["events"])
+        if "state_path" in data:
+            val = data["state_path"]
+            cfg.state_path = Path(val).expanduser() if val else None
         return cfg
 
 
+def _decide(flags: int, ac: bool, warn_hit: bool, crit_hit: bool, update_due: bool) -> tuple[int, int]:
+    """One step of the monitor state machine, free of I/O and clocks.
+
+    Takes the current ``_flags`` and a confirmed reading (AC present, and
+    whether warn/crit thresholds are breached and the battery update interval
+    has elapsed) and returns ``(new_flags, events)``, both bitmasks. A power
+    change resets warn/crit, which then fire once per outage; the first
+    reading of an outage starts the update timer instead of firing it. The
+    on-battery inputs are ignored on AC.
+    """
+    events = 0
+    if flags & _SEEN and ac != bool(flags & _AC):
+        events = _EV_RESTORED if ac else _EV_LOST
+        flags &= ~(_WARN | _CRIT)
+    if not ac:
+        if warn_hit and not flags & _WARN:
+            flags |= _WARN
+            events |= _EV_WARN
+        if crit_hit and not flags & _CRIT:
+            flags |= _CRIT
+            events |= _EV_CRIT
+        if update_due and not events & _EV_LOST:
+            events |= _EV_UPDATE
+    return (flags & ~_AC) | _SEEN | (_AC if ac else 0), events
+
+
 class UPSMonitor:
     """Monitors UPS and fires callbacks on state transitions.
 
     All events are configurable via EventsConfig. Omit an event to disable it.
 
     Callbacks receive (event_name, current_status, message).
+
+    Outage state (AC, battery start, warn/crit fired) is saved to
+    ``config.state_path`` whenever it changes, and periodically while on
+    battery, and restored on startup if recent, so a restart mid-outage
+    neither re-alerts nor loses the duration.
     """
 
+    __slots__ = (
+        "reader",
+        "config",
+        "on_event",
+        "pump",
+        "debounce_samples",
+        "_flags",
+        "_ac_pending",
+        "_ac_pending_count",
+        "_charge_hist",
+        "_event_q",
+        "_event_thread",
+        "_battery_since",
+        "_last_periodic",
+        "_last_saved",
+    )
+
+    # Saved state older than this many (AC) poll intervals is ignored; while
+    # on battery the file is re-saved every half of that so it stays fresh
+    STATE_MAX_AGE_POLLS = 4
+
     def __init__(
         self,
         reader: UPSReader,
         config: MonitorConfig,
         *,
         on_event: callable | None = None,
+        pump: _StatusPump | None = None,
+        debounce_samples: int = 2,
     ) -> None:
         self.reader = reader
         self.config = config
         self.on_event = on_event
-
-        # State tracking
-        self._prev_ac: bool | None = None
-        self._warn_fired = False
-        self._crit_fired = False
-        self._battery_since: float | None = None
+        self.pump = pump
+        self.debounce_samples = debounce_samples
+
+        # State tracking: _SEEN/_AC/_WARN/_CRIT bits
+        self._flags = 0
+        # AC flip seen but not yet confirmed by debounce_samples readings
+        self._ac_pending: bool | None = None
+        self._ac_pending_count = 0
+        # Recent on-battery charge readings; single-sample dips shouldn't fire warn/crit
+        self._charge_hist: deque[int] = deque(maxlen=CHARGE_WINDOW)
+        # Callbacks run on their own thread, started on the first event
+        self._event_q: queue.Queue = queue.Queue(maxsize=EVENT_QUEUE_SIZE)
+        self._event_thread: threading.Thread | None = None
+        self._battery_since: float | None = None  # time.monotonic()
         self._last_periodic: float = 0
+        self._last_saved: float = 0  # time.monotonic()
+        self._load_state()
+
+    def _state(self) -> dict:
+        flags = self._flags
+        return {
+            "prev_ac": bool(flags & _AC) if flags & _SEEN else None,
+            "battery_since": self._battery_since,
+            "warn_fired": bool(flags & _WARN),
+            "crit_fired": bool(flags & _CRIT),
+        }
 
-    def check(self) -> UPSStatus:
-        """Read UPS and fire events on state changes. Returns current status."""
-        status = self.reader.read()
-        now = time.time()
-        events = self.config.events
+    def _load_state(self) -> None:
+        path = self.config.state_path
+        if path is None:
+            return
+        try:
+            state = json.loads(path.read_bytes())
+            age = time.time() - state["saved_at"]
+            if age > self.config.poll_interval * self.STATE_MAX_AGE_POLLS:
+                log.info("Ignoring saved state %s from %.0fs ago", path, age)
+                return
+            prev_ac = state["prev_ac"]
+            since = state["battery_since"]
+            if since is not None:
+                since = float(since)
+            self._flags = (
+                (0 if prev_ac is None else _SEEN | (_AC if prev_ac else 0))
+                | (_WARN if state["warn_fired"] else 0)
+                | (_CRIT if state["crit_fired"] else 0)
+            )
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            # TypeError: valid JSON of the wrong shape, e.g. a list or null saved_at
+            log.warning("Ignoring saved state %s: %s", path, e)
+            return
+        if since is not None:
+            # Saved as wall time; map back onto this process's monotonic clock
+            self._battery_since = time.monotonic() - (time.time() - since)
+            # Don't send a battery_update the moment we come back up
+            self._last_periodic = time.monotonic()
+        log.info("Restored state from %s", path)
+
+    def _save_state(self) -> None:
+        path = self.config.state_path
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            state = self._state()
+            state["saved_at"] = time.time()
+            if self._battery_since is not None:
+                # Monotonic time is meaningless to the next process; save wall time
+                state["battery_since"] = time.time() - (time.monotonic() - self._battery_since)
+            tmp.write_text(_JSON(state))
+            os.replace(tmp, path)
+            self._last_saved = time.monotonic()
+        except OSError as e:
+            log.warning("Cannot save state to %s: %s", path, e)
+
+    def check(self) -> UPSStatus | None:
+        """Read UPS and fire events on state changes. Returns current status.
+
+        With a pump, waits for its next reading instead of reading directly,
+        and returns None if none arrives within a poll interval (plus slack).
+        """
+        if self.pump is not None:
+            status = self.pump.take(self.pump.interval + READ_STALL_SEC)
+            if status is None:
+                return None
+        else:
+            status = self.reader.read(force=True)
+
+        # Steady AC is nearly every poll: nothing to debounce, dispatch or save
+        flags = self._flags
+        ac = status.ac_present
+        if ac and flags & (_SEEN | _AC) == _SEEN | _AC and self._ac_pending is None:
+            return status
+
+        now = time.monotonic()
+
+        # A single glitchy report shouldn't count as a power change
+        if flags & _SEEN and ac != bool(flags & _AC):
+            self._ac_pending_count = self._ac_pending_count + 1 if self._ac_pending == ac else 1
+            self._ac_pending = ac
+            if self._ac_pending_count < self.debounce_samples:
+                log.debug("AC %s, waiting for confirmation", "present" if ac else "lost")
+                return status
+        self._ac_pending = None
+        self._ac_pending_count = 0
+
+        before = (flags, self._battery_since)
+
+        # Gather the raw on-battery inputs, then let _decide() do the bookkeeping
+        warn_reason = crit_reason = None
+        update_due = False
+        if not ac:
+            self._charge_hist.append(status.charge_pct)
+            # The outage starts now if the last confirmed reading was on AC.
+            # None if we started on battery with no saved state: length unknown
+            since = now if flags & _AC else self._battery_since
+            if since is not None:
+                warn_reason, crit_reason, update_due = self._battery_checks(status, now - since, now)
+
+        self._flags, fired = _decide(flags, ac, warn_reason is not None, crit_reason is not None, update_due)
+        if fired:
+            self._apply(fired, status, now, warn_reason, crit_reason)
+
+        # Touch the disk only when something changed, or periodically during
+        # an outage so a restart still finds the state fresh
+        if self.config.state_path is not None and (
+            (self._flags, self._battery_since) != before
+            or (
+                not ac
+                and now - self._last_saved >= self.config.poll_interval * self.STATE_MAX_AGE_POLLS / 2
+            )
+        ):
+            self._save_state()
+        return status
 
-        # AC state transition
-        if self._prev_ac is not None and status.ac_present != self._prev_ac:
-            if not status.ac_present:
-                # Lost AC
-                self._battery_since = now
-                self._last_periodic = now
-                self._warn_fired = False
-                self._crit_fired = False
-                if events.power_lost:
-                    self._fire(
-                        "power_lost",
-                        status,
-                        f"Power lost! On battery — {status.charge_pct}% charge, "
-                        f"{status.runtime_min:.0f} min runtime",
-                    )
-            else:
-                # AC restored
-                duration = now - self._battery_since if self._battery_since else 0
-                self._battery_since = None
-                self._warn_fired = False
-                self._crit_fired = False
-                if events.power_restored:
-                    self._fire(
-                        "power_restored",
-                        status,
-                        f"Power restored after {duration / 60:.1f} min — "
-                        f"{status.charge_pct}% charge, {status.input_voltage}V input",
-                    )
-
-        # Threshold checks (only while on battery)
-        if status.on_battery and self._battery_since is not None:
-            on_battery_sec = now - self._battery_since
-
-            if events.warn and not self._warn_fired:
-                reason = events.warn.check(status, on_battery_sec)
-                if reason:
-                    self._warn_fired = True
-                    self._fire(
-                        "battery_warn",
-                        status,
-                        f"Battery warning ({reason}) — "
-                        f"{status.charge_pct}%, {status.runtime_min:.0f} min remaining",
-                    )
-
-            if events.crit and not self._crit_fired:
-                reason = events.crit.check(status, on_battery_sec)
-                if reason:
-                    self._crit_fired = True
-                    self._fire(
-                        "battery_crit",
-                        status,
-                        f"BATTERY CRITICAL ({reason}) — "
-                        f"{status.charge_pct}%, {status.runtime_min:.0f} min remaining",
-                    )
-
-            # Periodic update while on battery
-            if events.battery_update and now - self._last_periodic >= events.battery_update:
-                self._last_periodic = now
+    def _battery_checks(
+        self, status: UPSStatus, on_battery_sec: float, now: float
+    ) -> tuple[str | None, str | None, bool]:
+        """Evaluate the thresholds and update timer; (warn, crit, update due)."""
+        events = self.config.events
+        # Median of recent readings, so one low sample can't trip a threshold
+        charge = statistics.median_low(self._charge_hist)
+        warn = events.warn.check(status, on_battery_sec, charge) if events.warn else None
+        crit = events.crit.check(status, on_battery_sec, charge) if events.crit else None
+        update_due = bool(events.battery_update and now - self._last_periodic >= events.battery_update)
+        return warn, crit, update_due
+
+    def _apply(
+        self, fired: int, status: UPSStatus, now: float, warn_reason: str | None, crit_reason: str | None
+    ) -> None:
+        """Update timers and fire the events _decide() reported."""
+        events = self.config.events
+        if fired & _EV_LOST:
+            self._battery_since = now
+            self._last_periodic = now
+            if events.power_lost:
                 self._fire(
-                    "battery_update",
+                    "power_lost",
                     status,
-                    f"On battery for {on_battery_sec / 60:.0f} min — "
-                    f"{status.charge_pct}%, {status.runtime_min:.0f} min remaining",
+                    "Power lost! On battery — %d%% charge, %.0f min runtime",
+                    status.charge_pct,
+                    status.runtime_min,
                 )
-
-        self._prev_ac = status.ac_present
-        return status
-
-    def _fire(self, event: str, status: UPSStatus, message: str) -> None:
-        """Log and dispatch an event."""
-        log.info("[%s] %s", event, message)
-        if self.on_event:
+        if fired & _EV_RESTORED:
+            duration = now - self._battery_since if self._battery_since else 0
+            self._battery_since = None
+            self._charge_hist.clear()
+            if events.power_restored:
+                self._fire(
+                    "power_restored",
+                    status,
+                    "Power restored after %.1f min — %d%% charge, %dV input",
+                    duration / 60,
+                    status.charge_pct,
+                    status.input_voltage,
+                )
+        if fired & (_EV_WARN | _EV_CRIT):
+            # Report the smoothed charge the thresholds were judged on
+            charge = statistics.median_low(self._charge_hist)
+        if fired & _EV_WARN:
+            self._fire(
+                "battery_warn",
+                status,
+                "Battery warning (%s) — %d%%, %.0f min remaining",
+                warn_reason,
+                charge,
+                status.runtime_min,
+            )
+        if fired & _EV_CRIT:
+            self._fire(
+                "battery_crit",
+                status,
+                "BATTERY CRITICAL (%s) — %d%%, %.0f min remaining",
+                crit_reason,
+                charge,
+                status.runtime_min,
+            )
+        if fired & _EV_UPDATE:
+            self._last_periodic = now
+            self._fire(
+                "battery_update",
+                status,
+                "On battery for %.0f min — %d%%, %.0f min remaining",
+                (now - self._battery_since) / 60,
+                status.charge_pct,
+                status.runtime_min,
+            )
+
+    def poll_interval(self, status: UPSStatus) -> float:
+        """Pick the next poll interval: slow on AC, fast on battery, fastest near crit.
+
+        An AC change still waiting for debounce keeps the battery pace either
+        way, so it is confirmed (or dropped) within a battery interval.
+        """
+        cfg = self.config
+        if status.ac_present and self._ac_pending is None:
+            return cfg.poll_interval
+        crit = cfg.events.crit
+        if crit and self._battery_since is not None:
+            on_battery_sec = time.monotonic() - self._battery_since
+            if crit.near(status, on_battery_sec):
+                return cfg.poll_interval_critical
+        return cfg.poll_interval_on_battery
+
+    def _fire(self, event: str, status: UPSStatus, fmt: str, *args: object) -> None:
+        """Log and dispatch an event.
+
+        The message is %-formatted lazily: logging formats it only if INFO is
+        enabled, and the callback's string is built only if a callback is set.
+        The callback runs on a background thread so a slow one can't delay
+        the next check().
+        """
+        if log.isEnabledFor(logging.INFO):
+            log.info("[%s] " + fmt, event, *args)
+        if not self.on_event:
+            return
+        if self._event_thread is None:
+            self._event_thread = threading.Thread(target=self._deliver_events, name="ups-events", daemon=True)
+            self._event_thread.start()
+        try:
+            self._event_q.put_nowait((event, status, fmt, args))
+        except queue.Full:
+            log.warning("Event queue full, dropped %s", event)
+
+    def _deliver_events(self) -> None:
+        while True:
+            event, status, fmt, args = self._event_q.get()
             try:
-                self.on_event(event, status, message)
+                self.on_event(event, status, fmt % args)
             except Exception:
                 log.exception("Event callback failed for %s", event)
+            finally:
+                self._event_q.task_done()
 
+    def flush(self, timeout: float | None = None) -> bool:
+        """Block until all queued events have been handed to the callback.
 
-def _make_alerter(notify: NotifyConfig):
-    """Create an alert callback using measurebot.alerts if configured."""
-    try:
-        from measurebot.alerts import send_email, send_discord_dm, send_slack_dm, send_slack_channel_message
+        Returns False if *timeout* seconds passed with events still queued.
+        """
+        q = self._event_q
+        with q.all_tasks_done:
+            return q.all_tasks_done.wait_for(lambda: not q.unfinished_tasks, timeout)
 
-        def _alert(event: str, status: UPSStatus, message: str) -> None:
-            subject = f"UPS: {event}"
-            body = f"UPS: {message}"
 
-            if notify.discord_users:
-                try:
-                    send_discord_dm(body, user=notify.discord_users)
-                except Exception:
-                    log.debug("Discord send failed", exc_info=True)
+class _Ticker:
+    """Periodic wakeups for the daemon loop.
 
-            if notify.slack_channel:
-                try:
-                    send_slack_channel_message(body, channel=notify.slack_channel, user=notify.slack_users or None)
-                except Exception:
-                    log.debug("Slack channel send failed", exc_info=True)
-            elif notify.slack_users:
-                try:
-                    send_slack_dm(body, user=notify.slack_users)
-                except Exception:
-                    log.debug("Slack DM send failed", exc_info=True)
+    On Linux with Python 3.13+ this arms a CLOCK_MONOTONIC timerfd so the
+    kernel fires each tick without userspace re-arming drift. Elsewhere it
+    sleeps to absolute monotonic deadlines. Either way, wait() returns the
+    number of ticks elapsed; more than 1 means ticks were missed (slow read,
+    suspend/resume) and were skipped rather than replayed. remaining() lets
+    another blocking wait (a UPS interrupt read) run up to the next tick.
+
+    set_interval() and interrupt() may be called from another thread and
+    take effect on a wait() already in progress.
+    """
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self._fd: int | None = None
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        if hasattr(os, "timerfd_create"):
+            self._fd = os.timerfd_create(time.CLOCK_MONOTONIC)
+            os.timerfd_settime(self._fd, initial=interval, interval=interval)
+        else:
+            self._deadline = time.monotonic() + interval
+
+    def wait(self) -> int:
+        """Block until the next tick. Returns ticks elapsed since the last wait."""
+        if self._fd is not None:
+            return int.from_bytes(os.read(self._fd, 8), sys.byteorder)
+        # Re-check the deadline whenever set_interval()/interrupt() moves it
+        while (sleep_for := self._deadline - time.monotonic()) > 0:
+            if self._wake.wait(sleep_for):
+                self._wake.clear()
+        ticks = 1 + max(0, math.floor((time.monotonic() - self._deadline) / self.interval))
+        self._deadline += ticks * self.interval
+        return ticks
+
+    def remaining(self) -> float:
+        """Seconds until the next tick; 0 if one is already due."""
+        if self._fd is not None:
+            if select.select([self._fd], [], [], 0)[0]:
+                return 0.0
+            return os.timerfd_gettime(self._fd)[0]
+        return max(0.0, self._deadline - time.monotonic())
+
+    def set_interval(self, interval: float) -> None:
+        """Change the period; the next tick is one new interval from now."""
+        if interval == self.interval:
+            return
+        self.interval = interval
+        with self._lock:
+            if self._fd is not None:
+                os.timerfd_settime(self._fd, initial=interval, interval=interval)
+                return
+        self._deadline = time.monotonic() + interval
+        self._wake.set()
+
+    def interrupt(self) -> None:
+        """Make a wait() in progress (or the next one) return now."""
+        with self._lock:
+            if self._fd is not None:
+                os.timerfd_settime(self._fd, initial=1e-9, interval=self.interval)
+                return
+        self._deadline = time.monotonic()
+        self._wake.set()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+
+
+class _StatusPump(threading.Thread):
+    """Reads the UPS on its own thread and hands over the latest status.
+
+    A stalled USB transfer (e.g. re-enumeration after resume) then only
+    delays this thread; the consumer waits with a timeout and moves on.
+    Owns the reader and closes it on exit.
+
+    Between reads it blocks on the UPS's interrupt endpoint until the next
+    tick, so a status change (AC lost) is read right away; the poll interval
+    is then only the idle refresh. After a reading whose AC state differs
+    from the one before, the next read comes within ``confirm_interval``
+    instead, so the change is confirmed without waiting out a long AC
+    interval. If the device can't do interrupt reads it falls back to plain
+    ticks.
+    """
 
-            if notify.email:
+    def __init__(
+        self,
+        reader: UPSReader,
+        interval: float,
+        confirm_interval: float,
+        stopping: threading.Event | None = None,
+    ) -> None:
+        super().__init__(name="ups-pump", daemon=True)
+        self.reader = reader
+        self.confirm_interval = confirm_interval
+        self.cond = threading.Condition()
+        self._latest: UPSStatus | None = None
+        # May be shared with the owner, which can then set it and notify cond
+        # to end take() without going through stop()
+        self._stopping = stopping or threading.Event()
+        self._ticker = _Ticker(interval)
+        self._events = True
+        # Consecutive failed reads; nonzero while backing off
+        self.fails = 0
+
+    @property
+    def interval(self) -> float:
+        return self._ticker.interval
+
+    def set_interval(self, interval: float) -> None:
+        self._ticker.set_interval(interval)
+
+    def run(self) -> None:
+        prev_ac = None
+        try:
+            while not self._stopping.is_set():
                 try:
-                    send_email(body, subject=subject, to_email=notify.email)
+                    status = self.reader.read(force=True)
                 except Exception:
-                    log.debug("Email send failed", exc_info=True)
+                    self.fails += 1
+                    self._recover(self.fails)
+                    continue
+                if self.fails:
+                    log.info("UPS reads recovered after %d failure(s)", self.fails)
+                    self.fails = 0
+                with self.cond:
+                    self._latest = status
+                    self.cond.notify_all()
+                changed = prev_ac is not None and status.ac_present != prev_ac
+                prev_ac = status.ac_present
+                self._wait(changed)
+        finally:
+            self._ticker.close()
+            self.reader.close()
+
+    def _recover(self, fails: int) -> None:
+        """Back off after a failed read, reopening the device if it keeps failing.
+
+        A wedged handle (I/O errors after a USB hiccup) doesn't come back by
+        polling it again; only the first failure of a run is logged loudly.
+        """
+        if fails == 1:
+            log.exception("UPS read failed")
+        else:
+            log.debug("UPS read failed (%d in a row)", fails, exc_info=True)
+        if fails >= READ_FAILS_BEFORE_REOPEN:
+            try:
+                self.reader.close()
+                self.reader.open()
+            except Exception as e:
+                log.debug("UPS reopen failed: %s", e)
+            else:
+                # A fresh handle gets another go at interrupt reads
+                self._events = True
+        self._stopping.wait(min(2**fails, MAX_BACKOFF_SEC))
+
+    def _wait(self, changed: bool) -> None:
+        """Sleep until the next tick or, if supported, a UPS status report."""
+        if self._events:
+            timeout = self._ticker.remaining()
+            shortened = changed and self.confirm_interval < timeout
+            if shortened:
+                timeout = self.confirm_interval
+            try:
+                # One blocking read per wait: hidapi can't be interrupted, and
+                # waking up just to check for set_interval()/stop() would cost
+                # a few wakeups a second forever
+                if timeout > 0 and self.reader.wait_for_event(timeout):
+                    log.debug("UPS reported a change")
+                    # Some units send bursts of reports; don't re-read faster
+                    # than the reader's own cache interval
+                    self._stopping.wait(self.reader.min_interval_s)
+                    return
+            except OSError as e:
+                log.warning("UPS interrupt reads unavailable (%s), polling instead", e)
+                self._events = False
+            else:
+                if shortened:
+                    return
+        # Otherwise the tick is due (or nearly); consume it
+        missed = self._ticker.wait() - 1
+        if missed:
+            log.debug("Skipped %d missed poll(s)", missed)
+
+    def take(self, timeout: float) -> UPSStatus | None:
+        """Wait up to timeout for a reading not yet taken, and take it.
+
+        Returns None on timeout or as soon as stop() is called.
+        """
+        with self.cond:
+            self.cond.wait_for(lambda: self._latest is not None or self._stopping.is_set(), timeout)
+            status, self._latest = self._latest, None
+        return status
 
-        return _alert
-    except Exception:
-        log.warning("measurebot alerts not configured — logging only")
-        return None
+    def stop(self) -> None:
+        """Ask the thread to exit after its current wait; wakes take() now.
+
+        A tick wait ends at once; a UPS interrupt read runs to its timeout.
+        """
+        self._stopping.set()
+        self._ticker.interrupt()
+        with self.cond:
+            self.cond.notify_all()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_senders():
+    """Import the measurebot.alerts senders on first use.
+
+    Keeps requests/smtplib and the .env parse out of daemon startup; most
+    runs never see an outage and never send anything.
+    """
+    from measurebot.alerts import send_email, send_discord_dm, send_slack_dm, send_slack_channel_message
+
+    return send_email, send_discord_dm, send_slack_dm, send_slack_channel_message
+
+
+def _make_alerter(notify: NotifyConfig, hold_sec: float = BRIEF_OUTAGE_SEC):
+    """Create an alert callback that sends via measurebot.alerts.
+
+    power_lost is held for ``hold_sec``; a restore confirmed meanwhile turns
+    the pair into one "brief outage" alert.
+    """
+    # One worker per channel, kept for the daemon's lifetime
+    executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix="measurebot-alert")
+    atexit.register(executor.shutdown)
+
+    # Recent send durations per channel; failures count as infinitely slow
+    latency: dict[str, deque[float]] = {}
+
+    def _rank(channel: str) -> float:
+        window = latency.get(channel)
+        return sum(window) / len(window) if window else 0.0
+
+    def _timed_send(channel: str, send) -> None:
+        start = time.monotonic()
+        ok = False
+        try:
+            ok = send() is not False
+        finally:
+            elapsed = time.monotonic() - start if ok else math.inf
+            latency.setdefault(channel, deque(maxlen=LATENCY_WINDOW)).append(elapsed)
+
+    def _log_failure(channel: str, future: Future) -> None:
+        exc = future.exception()
+        if exc is not None:
+            log.debug("%s send failed", channel, exc_info=exc)
+
+    def _dispatch(event: str, message: str) -> None:
+        try:
+            send_email, send_discord_dm, send_slack_dm, send_slack_channel_message = _get_senders()
+        except Exception:
+            log.warning("measurebot alerts not configured — logging only")
+            return
+
+        subject = f"UPS: {event}"
+        body = f"UPS: {message}"
+
+        sends = []
+        if notify.discord_users:
+            sends.append(("Discord", functools.partial(send_discord_dm, body, user=notify.discord_users)))
+        if notify.slack_channel:
+            sends.append(("Slack channel", functools.partial(
+                send_slack_channel_message, body, channel=notify.slack_channel, user=notify.slack_users or None
+            )))
+        elif notify.slack_users:
+            sends.append(("Slack DM", functools.partial(send_slack_dm, body, user=notify.slack_users)))
+        if notify.email:
+            sends.append(("Email", functools.partial(send_email, body, subject=subject, to_email=notify.email)))
+
+        # Deliver off the poll thread, all channels at once, so a slow SMTP
+        # handshake can't hold up the next UPS read or the other channels.
+        # Historically fastest channels go first in case the pool is busy.
+        sends.sort(key=lambda item: _rank(item[0]))
+        for channel, send in sends:
+            executor.submit(_timed_send, channel, send).add_done_callback(functools.partial(_log_failure, channel))
+
+    # Dedup/coalescing state, private to this alerter:
+    #   last_sent: battery_warn/crit -> when last sent; a reported power change
+    #     clears it, so a new outage's warn/crit always goes out
+    #   pending: a power_lost held for hold_sec
+    #   flap: the current ALERT_COOLDOWN_SEC window of power changes; those
+    #     past the first FLAP_ALERTS are counted and sent as one summary
+    #     when the window closes
+    last_sent: dict[str, float] = {}
+    pending: dict[str, tuple[threading.Timer, str]] = {}
+    flap: dict = {"start": -math.inf, "changes": 0, "suppressed": 0, "latest": "", "timer": None}
+    lock = threading.Lock()
+
+    def _send_pending_lost() -> None:
+        with lock:
+            entry = pending.pop("power_lost", None)
+        if entry:
+            entry[0].cancel()
+            _dispatch("power_lost", entry[1])
+
+    def _send_flap_summary() -> None:
+        with lock:
+            timer, count, latest = flap["timer"], flap["suppressed"], flap["latest"]
+            flap.update(start=-math.inf, changes=0, suppressed=0, timer=None)
+        if timer is None:
+            return
+        timer.cancel()
+        _dispatch(
+            "power_flapping",
+            f"AC flapping, {count} more power changes within {ALERT_COOLDOWN_SEC}s — latest: {latest}",
+        )
+
+    def _flush() -> None:
+        _send_pending_lost()
+        _send_flap_summary()
+
+    # Closure state is bound as defaults so each call uses fast local lookups
+    def _alert(
+        event: str,
+        status: UPSStatus,
+        message: str,
+        _dispatch=_dispatch,
+        _monotonic=time.monotonic,
+    ) -> None:
+        now = _monotonic()
+        lost = None
+        with lock:
+            if event in ("power_lost", "power_restored"):
+                lost = pending.pop("power_lost", None) if event == "power_restored" else None
+                if flap["timer"] is None and now - flap["start"] >= ALERT_COOLDOWN_SEC:
+                    flap["start"], flap["changes"] = now, 0
+                flap["changes"] += 1
+                # A restore that ends a held loss is merged below, never counted
+                if lost is None and flap["changes"] > FLAP_ALERTS:
+                    flap["suppressed"] += 1
+                    flap["latest"] = message
+                    if flap["timer"] is None:
+                        timer = threading.Timer(flap["start"] + ALERT_COOLDOWN_SEC - now, _send_flap_summary)
+                        timer.daemon = True
+                        flap["timer"] = timer
+                        timer.start()
+                    log.debug("Suppressed %s alert, AC flapping", event)
+                    return
+                last_sent.clear()
+
+                if event == "power_lost":
+                    # Hold briefly so a blip that restores right away is one message
+                    timer = threading.Timer(hold_sec, _send_pending_lost)
+                    timer.daemon = True
+                    pending["power_lost"] = (timer, message)
+                    timer.start()
+                    return
+            elif event != "battery_update":
+                # Drop repeats of the same alert within the cooldown; periodic
+                # updates are already paced by their own interval
+                for stale in [e for e, t in last_sent.items() if now - t >= ALERT_COOLDOWN_SEC]:
+                    del last_sent[stale]
+                if event in last_sent:
+                    log.debug("Suppressed duplicate %s alert", event)
+                    return
+                last_sent[event] = now
+
+        if lost:
+            lost[0].cancel()
+            _dispatch("brief_outage", f"Brief outage, power back within {hold_sec:g}s — {message}")
+        else:
+            _dispatch(event, message)
+
+    # Sends a held power_lost and any flapping summary right away; the daemon
+    # calls this on shutdown since their timers are daemon threads
+    _alert.flush = _flush
+    return _alert
+
+
+def _open_reader() -> UPSReader:
+    """Open the UPS or exit with an error."""
+    reader = UPSReader()
+    try:
+        reader.open()
+    except Exception as e:
+        log.error("Cannot open UPS: %s", e)
+        sys.exit(1)
+    log.info("Connected: %s (S/N: %s)", reader.product, reader.serial)
+    return reader
+
+
+def _single_read(as_json: bool) -> None:
+    """Print one UPS reading as a summary or JSON."""
+    reader = _open_reader()
+    try:
+        status = reader.read()
+    finally:
+        reader.close()
+    print(_JSON(status.to_dict()) if as_json else status.summary())
 
 
 def main() -> None:
+    # Plain status check (cron, monitoring plugins): skip argparse and
+    # logging setup entirely
+    if sys.argv[1:] in ([], ["--json"]):
+        _single_read(as_json=bool(sys.argv[1:]))
+        return
+
     parser = argparse.ArgumentParser(
         description="APC UPS monitor with notifications"
     )
@@ -358,7 +1070,26 @@ def main() -> None:
         "--poll-interval",
         type=float,
         metavar="SEC",
-        help="Poll interval in seconds (overrides config, default: 30)",
+        help="Poll interval on AC power in seconds (overrides config, default: 30)",
+    )
+    parser.add_argument(
+        "--poll-interval-battery",
+        type=float,
+        metavar="SEC",
+        help="Poll interval on battery in seconds (overrides config, default: 5)",
+    )
+    parser.add_argument(
+        "--poll-interval-critical",
+        type=float,
+        metavar="SEC",
+        help="Poll interval near a crit threshold in seconds (overrides config, default: 1)",
+    )
+    parser.add_argument(
+        "--debounce",
+        type=int,
+        default=2,
+        metavar="N",
+        help="Consecutive readings needed before an AC change counts (default: 2)",
     )
     parser.add_argument("--json", action="store_true", help="JSON output")
     parser.add_argument(
@@ -371,6 +1102,13 @@ def main() -> None:
         format="%(asctime)s %(levelname)s %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
     )
+    # Buffer DEBUG lines and write them out in batches; INFO and up (events,
+    # warnings) flush the buffer immediately so nothing important lags.
+    # logging.shutdown() flushes whatever is left at exit.
+    root = logging.getLogger()
+    root.handlers = [
+        logging.handlers.MemoryHandler(64, flushLevel=logging.INFO, target=handler) for handler in root.handlers
+    ]
 
     # Load config
     if args.config:
@@ -382,49 +1120,86 @@ def main() -> None:
     # CLI overrides
     if args.poll_interval is not None:
         config.poll_interval = args.poll_interval
-
-    reader = UPSReader()
-    try:
-        reader.open()
-    except Exception as e:
-        log.error("Cannot open UPS: %s", e)
-        sys.exit(1)
-
-    log.info("Connected: %s (S/N: %s)", reader.product, reader.serial)
+    if args.poll_interval_battery is not None:
+        config.poll_interval_on_battery = args.poll_interval_battery
+    if args.poll_interval_critical is not None:
+        config.poll_interval_critical = args.poll_interval_critical
 
     if not args.daemon:
-        # Single read
-        status = reader.read()
-        if args.json:
-            print(json.dumps(status.to_dict()))
-        else:
-            print(status.summary())
-        reader.close()
+        _single_read(args.json)
         return
 
     # Daemon mode
-    alerter = _make_alerter(config.notify)
-    monitor = UPSMonitor(reader, config, on_event=alerter)
+    reader = _open_reader()
+    # A restore takes up to debounce battery polls to confirm, so the hold
+    # has to cover that on top of the outage itself
+    alerter = _make_alerter(config.notify, BRIEF_OUTAGE_SEC + args.debounce * config.poll_interval_on_battery)
+    stop = threading.Event()
+    pump = _StatusPump(reader, config.poll_interval, config.poll_interval_on_battery, stopping=stop)
+    monitor = UPSMonitor(reader, config, on_event=alerter, pump=pump, debounce_samples=args.debounce)
 
     log.info(
-        "Monitoring every %gs — events: [%s] — notify: %s",
+        "Monitoring every %gs (%gs on battery, %gs near crit) — events: [%s] — notify: %s",
         config.poll_interval,
+        config.poll_interval_on_battery,
+        config.poll_interval_critical,
         config.events.summary(),
         config.notify.summary(),
     )
 
+    # SIGTERM (systemctl stop) and Ctrl-C both end the loop at once instead
+    # of after the current wait. The handler runs on the main thread, which
+    # may be inside pump.set_interval() holding the ticker's lock, so it only
+    # sets the shared stop event and wakes take() (cond is an RLock); the loop
+    # calls pump.stop(). A second signal kills the process outright, in case
+    # shutdown hangs flushing alerts.
+    def _on_signal(signum: int, frame: object) -> None:
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        stop.set()
+        with pump.cond:
+            pump.cond.notify_all()
+
+    signal.signal(signal.SIGTERM, _on_signal)
+    signal.signal(signal.SIGINT, _on_signal)
+
+    pump.start()
+    last_key = None
+    stalled = False
     try:
-        while True:
+        while not stop.is_set():
             try:
                 status = monitor.check()
-                log.debug("%s", status.oneliner())
+                if status is None:
+                    # Warn once per stall; read failures are already logged by
+                    # the pump, which backs off without producing readings
+                    if not (stalled or pump.fails or stop.is_set()):
+                        log.warning("No UPS reading for %gs", pump.interval + READ_STALL_SEC)
+                        stalled = True
+                    continue
+                stalled = False
+                # Only log readings that differ from the previous one, and
+                # don't build the line at all unless DEBUG is on
+                if log.isEnabledFor(logging.DEBUG):
+                    key = status.state_key
+                    if key != last_key:
+                        last_key = key
+                        log.debug("%s", status.oneliner())
+                interval = monitor.poll_interval(status)
+                if interval != pump.interval:
+                    log.info("Poll interval now %gs", interval)
+                    pump.set_interval(interval)
             except Exception:
-                log.exception("UPS read failed")
-            time.sleep(config.poll_interval)
-    except KeyboardInterrupt:
+                log.exception("UPS check failed")
         log.info("Stopped.")
     finally:
-        reader.close()
+        pump.stop()
+        pump.join(timeout=READ_STALL_SEC)
+        # Hand queued events to the alerter, then release a held power_lost;
+        # the alert executor's atexit shutdown waits for the sends
+        if not monitor.flush(timeout=SHUTDOWN_FLUSH_SEC):
+            log.warning("Shutting down with undelivered UPS events")
+        alerter.flush()
 
 
 if __name__ == "__main__":
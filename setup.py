@@ -42,6 +42,7 @@ setup(
     install_requires=requirements,
     extras_require={
         "ups": ["hidapi"],
+        "async": ["aiohttp"],
     },
     entry_points={
         "console_scripts": [